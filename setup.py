@@ -14,7 +14,7 @@ setup(
     long_description_content_type="text/markdown",
     python_requires=">=3.6",
     py_modules=["super_stepper"],
-    install_requires=[],
+    install_requires=["rich>=10.0.0"],
     keywords=["python", "package", "automation", "tools"],
     classifiers=["Development Status :: 3 - Alpha", "Intended Audience :: Developers", "License :: OSI Approved :: MIT License", "Operating System :: OS Independent", "Programming Language :: Python :: 3", "Programming Language :: Python :: 3.8", "Programming Language :: Python :: 3.9", "Programming Language :: Python :: 3.10", "Programming Language :: Python :: 3.11", "Programming Language :: Python :: 3.12", "Topic :: Software Development :: Libraries :: Python Modules", "Topic :: Utilities"],
     project_urls={"Bug Reports": "https://github.com/ltanedo/super-stepper/issues","Source": "https://github.com/ltanedo/super-stepper","Documentation": "https://github.com/ltanedo/super-stepper#readme"},
@@ -2,50 +2,77 @@
 """
 Shared state module for super_stepper workflow example.
 Demonstrates how tasks can modify shared variables across phases.
+
+Each group of state is a small class with __slots__, so tasks read and write
+plain attributes (state.config.log_level) instead of dict keys.
 """
 
-class AppState:
+class ConfigState:
+    """Configuration state."""
+    __slots__ = ("database_url", "api_key", "log_level", "max_connections")
+
     def __init__(self):
-        # Configuration state
-        self.config = {
-            "database_url": None,
-            "api_key": None,
-            "log_level": "INFO",
-            "max_connections": 10
-        }
+        self.database_url = None
+        self.api_key = None
+        self.log_level = "INFO"
+        self.max_connections = 10
 
-        # Database connection state
-        self.database = {
-            "connection": None,
-            "is_connected": False,
-            "connection_time": None,
-            "last_error": None
-        }
 
-        # Data processing state
-        self.processing = {
-            "users_fetched": 0,
-            "transactions_processed": 0,
-            "reports_generated": [],
-            "processing_start_time": None,
-            "processing_end_time": None
-        }
+class DatabaseState:
+    """Database connection state."""
+    __slots__ = ("connection", "is_connected", "connection_time", "last_error")
 
-        # Cleanup and notification state
-        self.cleanup = {
-            "files_archived": 0,
-            "archive_path": None,
-            "notifications_sent": [],
-            "cleanup_errors": []
-        }
+    def __init__(self):
+        self.connection = None
+        self.is_connected = False
+        self.connection_time = None
+        self.last_error = None
 
-        # Overall workflow state
-        self.workflow = {
-            "start_time": None,
-            "end_time": None,
-            "phases_completed": [],
-            "overall_success": False
-        }
+
+class ProcessingState:
+    """Data processing state."""
+    __slots__ = ("users_fetched", "transactions_processed", "reports_generated",
+                 "processing_start_time", "processing_end_time")
+
+    def __init__(self):
+        self.users_fetched = 0
+        self.transactions_processed = 0
+        self.reports_generated = []
+        self.processing_start_time = None
+        self.processing_end_time = None
+
+
+class CleanupState:
+    """Cleanup and notification state."""
+    __slots__ = ("files_archived", "archive_path", "notifications_sent", "cleanup_errors")
+
+    def __init__(self):
+        self.files_archived = 0
+        self.archive_path = None
+        self.notifications_sent = []
+        self.cleanup_errors = []
+
+
+class WorkflowState:
+    """Overall workflow state."""
+    __slots__ = ("start_time", "end_time", "phases_completed", "overall_success")
+
+    def __init__(self):
+        self.start_time = None
+        self.end_time = None
+        self.phases_completed = []
+        self.overall_success = False
+
+
+class AppState:
+    __slots__ = ("config", "database", "processing", "cleanup", "workflow", "cache", "user")
+
+    def __init__(self):
+        self.config = ConfigState()
+        self.database = DatabaseState()
+        self.processing = ProcessingState()
+        self.cleanup = CleanupState()
+        self.workflow = WorkflowState()
 
         # Legacy fields for compatibility
         self.cache = {}
@@ -58,14 +85,14 @@ class AppState:
     def get_summary(self):
         """Return a summary of current state."""
         return {
-            "config_loaded": self.config["database_url"] is not None,
-            "database_connected": self.database["is_connected"],
-            "users_processed": self.processing["users_fetched"],
-            "transactions_processed": self.processing["transactions_processed"],
-            "files_archived": self.cleanup["files_archived"],
-            "notifications_sent": len(self.cleanup["notifications_sent"]),
-            "phases_completed": len(self.workflow["phases_completed"])
+            "config_loaded": self.config.database_url is not None,
+            "database_connected": self.database.is_connected,
+            "users_processed": self.processing.users_fetched,
+            "transactions_processed": self.processing.transactions_processed,
+            "files_archived": self.cleanup.files_archived,
+            "notifications_sent": len(self.cleanup.notifications_sent),
+            "phases_completed": len(self.workflow.phases_completed)
         }
 
 # Global state instance
-state = AppState()
\ No newline at end of file
+state = AppState()
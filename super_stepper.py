@@ -31,26 +31,145 @@ Example:
     print_summary()
 """
 
+import os
 import time
+import bisect
 import threading
+from contextlib import contextmanager
 from typing import Dict, List, Tuple, Callable, Any
 from functools import wraps
 from rich.console import Console
 from rich.text import Text
+from rich.style import Style
 from rich.live import Live
+from rich.segment import Segment
+
+
+class _PrivateModeSequence:
+    """
+    Renderable that writes a raw DEC private mode escape sequence.
+
+    Rich has no ControlType for most private modes, so the segment carries a
+    control code of its own: Rich treats it as a zero-width control (never
+    cropped, skipped for non-terminal output) without mistaking it for one of
+    its own terminal operations.
+    """
+    __slots__ = ("segment",)
+
+    def __init__(self, code: str, name: str):
+        self.segment = Segment(code, None, [(name,)])
+
+    def __rich_console__(self, console, options):
+        yield self.segment
+
+
+# Begin/end a synchronized update (DEC mode 2026): supporting terminals hold the
+# screen until the whole frame has been written, others ignore the sequences
+_begin_synchronized_update = _PrivateModeSequence("\x1b[?2026h", "begin_synchronized_update")
+_end_synchronized_update = _PrivateModeSequence("\x1b[?2026l", "end_synchronized_update")
+
+
+class _SynchronizedLive(Live):
+    """
+    Live display that wraps each repaint in a synchronized update to avoid tearing.
+
+    Scheduled repaints are skipped while nothing has changed, no task is
+    running and the terminal has not been resized, so a finished workflow stops
+    writing to the terminal until summary() stops the display.
+    """
+
+    def refresh(self) -> None:
+        # Always repaint once stopped, so the final frame is drawn
+        if (self.is_started and _frame is not None and not _dirty and not _running_tasks
+                and self.console.size == _frame_size):
+            return
+        super().refresh()
+
+    def process_renderables(self, renderables):
+        renderables = super().process_renderables(renderables)
+        console = self.console
+        if console.is_terminal and not console.is_dumb_terminal and not console.legacy_windows:
+            renderables = [_begin_synchronized_update, *renderables, _end_synchronized_update]
+        return renderables
+
+
+def _read_refresh_rate(default: float = 4.0) -> float:
+    """Return the repaint rate from SUPER_STEPPER_FPS, or the default if it is unset or invalid."""
+    try:
+        rate = float(os.environ.get("SUPER_STEPPER_FPS", default))
+    except ValueError:
+        return default
+    # Live needs a positive rate; an infinite one would refresh in a busy loop
+    if not 0 < rate < float("inf"):
+        return default
+    return rate
+
+
+class TaskEntry:
+    """Registry record for a single decorated task; status fields are updated in place."""
+    __slots__ = ("increment", "task", "func", "completed", "success", "message")
+
+    def __init__(self, increment: float, task: str, func: Callable):
+        self.increment = increment
+        self.task = task
+        self.func = func
+        self.completed = False
+        self.success = False
+        self.message = ""
+
+    def __lt__(self, other: "TaskEntry") -> bool:
+        # Entries order by increment, which keeps bisect.insort stable for ties
+        return self.increment < other.increment
+
 
 # Global storage for tasks and results
-_tasks: Dict[str, List[Tuple[float, str, Callable, bool, bool, str]]] = {}  # phase -> [(increment, task, func, completed, success, message)]
-_failed_tasks: List[Tuple[str, str, str]] = []  # [(phase, task, error_message)]
-_all_task_messages: List[Tuple[str, str, str, bool]] = []  # [(phase, task, message, success)]
-_phase_order: List[str] = []  # Track the order phases are encountered
+_tasks: Dict[str, List[TaskEntry]] = {}  # phase -> [TaskEntry], kept sorted by increment; phases in order first seen
+_task_index: Dict[Tuple[str, float, str], TaskEntry] = {}  # (phase, increment, task) -> entry
+_counts: Dict[str, int] = {"total": 0, "failed": 0}  # Kept current by _register_task and wrapper
 _console = Console()
 _live_display = None
-_current_task = None
+_running_tasks: Dict[TaskEntry, int] = {}  # entry -> number of calls currently executing
+_current_phase = None  # Phase of the most recently started task
+_expand_all = False  # Render every phase in full (set for the final frame)
+# Styles are parsed once here rather than from strings on every render
+_style_phase = Style(color="cyan", bold=True)
+_style_phase_collapsed = Style(color="cyan", dim=True)
+_style_task = Style(color="white")
+_style_dim = Style(color="white", dim=True)
+_style_ok = Style(color="green")
+_style_error = Style(color="red")
+_style_running = Style(color="yellow")
+_style_summary_ok = Style(color="green", bold=True)
+_style_summary_error = Style(color="red", bold=True)
 _spinner_chars = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
-_spinner_index = 0
+_spinner_glyphs = [f"  {char} " for char in _spinner_chars]  # Row prefixes for running tasks
+_glyph_ok = Text("  ✓ ", style=_style_ok)
+_glyph_fail = Text("  ✗ ", style=_style_error)
+_refresh_per_second = _read_refresh_rate()  # Live repaint rate; the spinner advances once per repaint
+_dirty = True  # Task state changed since the last frame was generated
+_frame = None  # Last frame built by _generate_display, reused while nothing changes
+_frame_size = None  # Console size _frame was built for; a resize can change which phases collapse
+_frame_parts: List[Any] = []  # Static Text chunks of the frame, with running task names where spinner rows go
 _display_started = False
 _workflow_started = False  # Track if workflow has been started
+_batch_depth = 0  # Number of open batch_updates() blocks; the per-step repaint is skipped while non-zero
+_state_lock = threading.RLock()  # Guards task state shared between step callers and the display
+
+
+def _register_task(phase: str, increment: float, task: str, func: Callable) -> TaskEntry:
+    """Return the registry entry for a task, adding it (and its phase) if missing."""
+    key = (phase, increment, task)
+    entry = _task_index.get(key)
+    if entry is None:
+        entries = _tasks.get(phase)
+        if entries is None:
+            # First task seen for this phase
+            entries = _tasks[phase] = []
+        entry = TaskEntry(increment, task, func)
+        bisect.insort(entries, entry)
+        _task_index[key] = entry
+        _counts["total"] += 1
+    return entry
 
 
 def step(phase: str, task: str, increment: float):
@@ -66,58 +185,39 @@ def step(phase: str, task: str, increment: float):
         bool: True if the task succeeded, False if it failed
     """
     def decorator(func: Callable) -> Callable:
-        # Register the task when decorator is applied
-        if phase not in _tasks:
-            _tasks[phase] = []
-            # Track phase order
-            if phase not in _phase_order:
-                _phase_order.append(phase)
-
-        # Check if task already exists to avoid duplicates
-        task_exists = False
-        for inc, tsk, f, completed, success, error_msg in _tasks[phase]:
-            if inc == increment and tsk == task and f == func:
-                task_exists = True
-                break
-
-        if not task_exists:
-            _tasks[phase].append((increment, task, func, False, False, ""))
+        # Register the task when decorator is applied; a task is identified by
+        # phase, increment and name, so re-decorating the same step is ignored
+        key = (phase, increment, task)
+        with _state_lock:
+            _register_task(phase, increment, task, func)
 
         @wraps(func)
         def wrapper(*args, **kwargs):
-            global _current_task, _display_started, _workflow_started
-
-            # Auto-reset and start workflow on first task execution
-            if not _workflow_started:
-                _auto_reset()
-                _workflow_started = True
-
-            # Ensure phase exists
-            if phase not in _tasks:
-                _tasks[phase] = []
-                # Also ensure phase order is maintained
-                if phase not in _phase_order:
-                    _phase_order.append(phase)
-
-            # Find this task in the registry
-            task_entry = None
-            for i, (inc, tsk, f, completed, success, error_msg) in enumerate(_tasks[phase]):
-                if inc == increment and tsk == task and f == func:
-                    task_entry = i
-                    break
-
-            if task_entry is None:
-                # This shouldn't happen, but add as fallback
-                _tasks[phase].append((increment, task, func, False, False, ""))
-                task_entry = len(_tasks[phase]) - 1
-
-            # Start live display if not already started
-            if not _display_started:
-                _start_live_display()
-                _display_started = True
-
-            # Set current task for spinner
-            _current_task = (phase, task)
+            global _current_phase, _display_started, _workflow_started, _dirty
+
+            # Steps may be called from several threads at once, so only one
+            # caller may reset, register or start the display at a time
+            with _state_lock:
+                # Auto-reset and start workflow on first task execution
+                if not _workflow_started:
+                    _auto_reset()
+                    _workflow_started = True
+
+                # Find this task in the registry; a reset clears it, so register again on a miss
+                entry = _task_index.get(key)
+                if entry is None:
+                    entry = _register_task(phase, increment, task, func)
+
+                # Start live display if not already started
+                if not _display_started:
+                    _start_live_display()
+                    _display_started = True
+
+                # Mark task as running for the spinner; the same step may be in
+                # flight on several threads, so count the calls
+                _running_tasks[entry] = _running_tasks.get(entry, 0) + 1
+                _current_phase = phase
+                _dirty = True
 
             try:
                 # Execute the function
@@ -134,124 +234,211 @@ def step(phase: str, task: str, increment: float):
                     success = bool(result)
                     message = ""
 
-                # Update task status
-                _tasks[phase][task_entry] = (increment, task, func, True, success, message)
-
-                # Track all tasks with messages
-                if message:
-                    _all_task_messages.append((phase, task, message, success))
+            except Exception as e:
+                # Capture exception message as error
+                success = False
+                message = str(e)
+
+            with _state_lock:
+                # Keep the summary counters in step with the entry; a re-run
+                # replaces the earlier result rather than adding to it. A reset
+                # while the task ran has already zeroed them, so skip the update
+                # unless the entry is still the registered one
+                if _task_index.get(key) is entry:
+                    if entry.completed and not entry.success:
+                        _counts["failed"] -= 1
+                    if not success:
+                        _counts["failed"] += 1
 
-                # Track failed tasks (for backward compatibility with existing summary)
-                if not success:
-                    _failed_tasks.append((phase, task, message))
+                # Update task status
+                entry.completed = True
+                entry.success = success
+                entry.message = message
 
-                # Clear current task since it's completed
-                _current_task = None
+                # Task is no longer running once its last in-flight call returns
+                # (a reset while it ran has already dropped it)
+                running = _running_tasks.get(entry, 0)
+                if running > 1:
+                    _running_tasks[entry] = running - 1
+                elif running:
+                    del _running_tasks[entry]
+                _dirty = True
 
-                # Give the background thread time to update the display
-                time.sleep(0.2)
+            # Paint the result right away instead of waiting for the next refresh
+            if not _batch_depth:
+                _refresh_now()
 
-                return success
+            return success
 
-            except Exception as e:
-                # Capture exception message as error
-                error_message = str(e)
+        return wrapper
+    return decorator
 
-                # Update task status as failed
-                _tasks[phase][task_entry] = (increment, task, func, True, False, error_message)
 
-                # Track all tasks with messages
-                if error_message:
-                    _all_task_messages.append((phase, task, error_message, False))
+def _refresh_now():
+    """Repaint the live display immediately, if one is showing on a terminal."""
+    live = _live_display
+    if live is not None and _console.is_terminal:
+        live.refresh()
 
-                _failed_tasks.append((phase, task, error_message))
 
-                # Clear current task since it's completed
-                _current_task = None
+@contextmanager
+def batch_updates():
+    """
+    Coalesce display refreshes for the steps run inside the block.
 
-                # Give the background thread time to update the display
-                time.sleep(0.2)
+    Each completed step normally repaints the display immediately. Inside
+    ``with batch_updates():`` those repaints are skipped and a single one is
+    made when the block exits, which suits many fast steps run back-to-back.
+    The regular background refresh still keeps the spinner moving.
 
-                return False
+    Blocks may be nested or opened from several threads at once; repaints stay
+    deferred until the last open block exits.
+    """
+    global _batch_depth
 
-        return wrapper
-    return decorator
+    with _state_lock:
+        _batch_depth += 1
+    try:
+        yield
+    finally:
+        with _state_lock:
+            _batch_depth -= 1
+            done = not _batch_depth
+        if done:
+            _refresh_now()
 
 
 def _start_live_display():
-    """Start the live display showing all tasks."""
-    global _live_display
-
-    def update_spinner():
-        global _spinner_index
-        while _live_display and _live_display.is_started:
-            _spinner_index = (_spinner_index + 1) % len(_spinner_chars)
-            if _live_display:
-                _live_display.update(_generate_display())
-            time.sleep(0.1)
-
-    _live_display = Live(_generate_display(), console=_console, refresh_per_second=10)
-    _live_display.start()
+    """
+    Start the live display showing all tasks.
 
-    # Start spinner animation in background thread
-    spinner_thread = threading.Thread(target=update_spinner, daemon=True)
-    spinner_thread.start()
+    Live's own refresh thread pulls each frame from _generate_display, so no
+    separate spinner thread is needed.
+    """
+    global _live_display, _expand_all, _dirty
+
+    _expand_all = False
+    _dirty = True
+    _live_display = _SynchronizedLive(
+        console=_console,
+        refresh_per_second=_refresh_per_second,
+        auto_refresh=True,
+        get_renderable=_generate_display,
+    )
+    _live_display.start()
 
 
 def _generate_display():
-    """Generate the current display showing all tasks with their status."""
+    """
+    Return the current frame, rebuilding it only when something has changed.
+
+    The static parts of the frame are rebuilt only when a task changes state
+    or the terminal is resized (which can change which phases collapse);
+    while tasks are running, each refresh just redraws their spinner rows
+    between the cached parts. This runs on Live's refresh thread, which never
+    waits for _state_lock: if a step is updating task state, the previous frame
+    is shown for one more refresh instead.
+    """
+    global _dirty, _frame, _frame_parts, _frame_size
+
+    if not _state_lock.acquire(blocking=False):
+        return _frame if _frame is not None else Text()
+    try:
+        size = _console.size
+        if _frame is None or _dirty or size != _frame_size:
+            _dirty = False
+            _frame_size = size
+            _frame_parts = _build_frame_parts()
+            _frame = _assemble_frame(_frame_parts)
+        elif _running_tasks:
+            # Only the spinner glyphs have moved
+            _frame = _assemble_frame(_frame_parts)
+        return _frame
+    finally:
+        _state_lock.release()
+
+
+def _assemble_frame(parts: List[Any]) -> Text:
+    """Join cached frame parts into one Text, drawing a spinner row for each running task."""
+    # Spinner position follows the clock, advancing once per refresh
+    spinner_glyph = _spinner_glyphs[int(time.monotonic() * _refresh_per_second) % len(_spinner_glyphs)]
+    return Text.assemble(*[
+        part if isinstance(part, Text) else Text(f"{spinner_glyph}{part}\n", style=_style_running)
+        for part in parts
+    ])
+
+
+def _build_frame_parts() -> List[Any]:
+    """
+    Build the display showing all tasks with their status, split around running tasks.
+
+    Returns a list of Text chunks; the row of each running task is left out and
+    its task name is put in its place, for _assemble_frame to fill in.
+
+    If the full task list would not fit on the terminal, every phase except the
+    one currently running is collapsed to a single "PHASE done/total" line.
+    """
+    parts = []
     display = Text()
 
-    # Use phase order as encountered (same as print_summary)
-    for phase in _phase_order:
-        if not _tasks[phase]:
+    # Phase header and trailing blank line plus one row per task
+    total_rows = sum(len(tasks) + 2 for tasks in _tasks.values() if tasks)
+    collapse = not _expand_all and total_rows > _console.size.height
+
+    # Phases in the order first encountered (dicts keep insertion order)
+    for phase, entries in _tasks.items():
+        if not entries:
             continue
 
-        # Print phase header
-        phase_text = Text()
-        phase_text.append(f"{phase.upper()}", style="bold cyan")
-        display.append(phase_text)
-        display.append("\n")
+        if collapse and phase != _current_phase:
+            done = sum(1 for entry in entries if entry.completed)
+            display.append(f"{phase.upper()} {done}/{len(entries)}\n", style=_style_phase_collapsed)
+            continue
 
-        # Sort tasks by increment
-        sorted_tasks = sorted(_tasks[phase], key=lambda x: x[0])
+        # Print phase header
+        display.append(f"{phase.upper()}\n", style=_style_phase)
 
-        for increment, task_name, func, completed, success, error_msg in sorted_tasks:
-            if completed:
+        # Tasks are already sorted by increment at registration. Each row is
+        # appended as one run per style, with the newline folded into the last run.
+        for entry in entries:
+            if entry.completed:
                 # Task is completed - show checkmark or X
-                if success:
-                    display.append("  ✓ ", style="green")
-                else:
-                    display.append("  ✗ ", style="red")
-                display.append(f"{task_name}", style="white")
+                display.append_text(_glyph_ok if entry.success else _glyph_fail)
                 # Add message if available (color based on success/failure)
-                if error_msg:
-                    if success:
-                        display.append(f" - {error_msg}", style="dim white")
+                if entry.message:
+                    display.append(entry.task, style=_style_task)
+                    if entry.success:
+                        display.append(f" - {entry.message}\n", style=_style_dim)
                     else:
-                        display.append(f" - {error_msg}", style="red")
-            elif _current_task and _current_task[0] == phase and _current_task[1] == task_name:
-                # Show spinner for current task
-                spinner_char = _spinner_chars[_spinner_index]
-                display.append(f"  {spinner_char} ", style="yellow")
-                display.append(f"{task_name}", style="yellow")
+                        display.append(f" - {entry.message}\n", style=_style_error)
+                else:
+                    display.append(f"{entry.task}\n", style=_style_task)
+            elif entry in _running_tasks:
+                # Leave a slot for the running task's spinner row
+                parts.append(display)
+                parts.append(entry.task)
+                display = Text()
             else:
                 # Task not started yet
-                display.append("  - ", style="dim white")
-                display.append(f"{task_name}", style="dim white")
-            display.append("\n")
+                display.append(f"  - {entry.task}\n", style=_style_dim)
 
         display.append("\n")
 
-    return display
+    parts.append(display)
+    return parts
 
 
 def _stop_live_display():
-    """Stop the live display."""
-    global _live_display
-    if _live_display:
-        _live_display.stop()
-        _live_display = None
+    """Stop the live display, leaving every phase expanded in the final frame."""
+    global _live_display, _expand_all, _dirty
+    with _state_lock:
+        if _live_display:
+            # Live renders one last frame on stop; holding the lock makes sure
+            # that frame is rebuilt from the final task state
+            _expand_all = True
+            _dirty = True
+            _live_display.stop()
+            _live_display = None
 
 
 def summary():
@@ -261,20 +448,10 @@ def summary():
     # Stop the live display first
     _stop_live_display()
 
-    # Calculate statistics
-    total_tasks = 0
-    completed_tasks = 0
-    failed_tasks = 0
-
-    for phase in _phase_order:
-        if not _tasks[phase]:
-            continue
-        for increment, task_name, func, completed, success, error_msg in _tasks[phase]:
-            total_tasks += 1
-            if completed:
-                completed_tasks += 1
-                if not success:
-                    failed_tasks += 1
+    # Statistics are maintained as tasks register and finish
+    with _state_lock:
+        total_tasks = _counts["total"]
+        failed_tasks = _counts["failed"]
 
     # Print summary header in same style as phase headers
     summary_header = Text()
@@ -285,22 +462,15 @@ def summary():
     if total_tasks > 0:
         if failed_tasks > 0:
             # Simple error summary
-            status_text = Text()
-            status_text.append(f"⚠️  ", style="bold red")
-            status_text.append(f"{failed_tasks} of {total_tasks} tasks failed", style="bold red")
-            _console.print(status_text)
+            status_text = Text("⚠️  %d of %d tasks failed" % (failed_tasks, total_tasks), style=_style_summary_error)
         else:
             # All tasks completed successfully
-            status_text = Text()
-            status_text.append(f"✅ ", style="bold green")
-            status_text.append(f"{total_tasks} of {total_tasks} tasks completed successfully", style="bold green")
-            _console.print(status_text)
+            status_text = Text("✅ %d of %d tasks completed successfully" % (total_tasks, total_tasks), style=_style_summary_ok)
     else:
-        status_text = Text()
-        status_text.append("  No tasks found", style="dim white")
-        _console.print(status_text)
+        status_text = Text("  No tasks found", style=_style_dim)
 
-    _console.print()
+    # Status line and trailing blank line go out in a single write
+    _console.print(status_text, end="\n\n")
 
     # Mark workflow as completed so next task execution will auto-reset
     _workflow_started = False
@@ -309,34 +479,37 @@ def start_workflow():
     """Start the workflow by displaying all registered tasks. This is now called automatically."""
     global _display_started, _workflow_started
 
-    # Mark workflow as started (prevents auto-reset)
-    _workflow_started = True
+    with _state_lock:
+        # Mark workflow as started (prevents auto-reset)
+        _workflow_started = True
 
-    if not _display_started and _tasks:
-        _start_live_display()
-        _display_started = True
+        if not _display_started and _tasks:
+            _start_live_display()
+            _display_started = True
 
 
 def _auto_reset():
     """Internal function to automatically reset state when workflow starts."""
-    global _tasks, _failed_tasks, _phase_order, _all_task_messages, _display_started, _live_display
+    global _display_started, _current_phase, _dirty
 
     # Stop any existing live display
-    if _live_display:
-        _live_display.stop()
-        _live_display = None
+    _stop_live_display()
 
     # Clear all data
     _tasks.clear()
-    _failed_tasks.clear()
-    _phase_order.clear()
-    _all_task_messages.clear()
+    _task_index.clear()
+    _running_tasks.clear()
+    for name in _counts:
+        _counts[name] = 0
     _display_started = False
+    _current_phase = None
+    _dirty = True
 
 
 def reset():
     """Reset all tasks and failed task tracking. Call this to manually reset between workflows."""
     global _workflow_started
 
-    _auto_reset()
-    _workflow_started = False
+    with _state_lock:
+        _auto_reset()
+        _workflow_started = False
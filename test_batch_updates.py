@@ -0,0 +1,42 @@
+"""
+Test that batch_updates() blocks opened from several threads are tracked correctly.
+"""
+
+import threading
+import super_stepper
+
+
+def test_overlapping_batches_exit_out_of_order():
+    a_entered = threading.Event()
+    b_entered = threading.Event()
+    a_exited = threading.Event()
+
+    def thread_a():
+        with super_stepper.batch_updates():
+            a_entered.set()
+            b_entered.wait()
+        a_exited.set()
+
+    def thread_b():
+        a_entered.wait()
+        with super_stepper.batch_updates():
+            b_entered.set()
+            a_exited.wait()
+            # A's block has closed but this one is still open
+            assert super_stepper._batch_depth == 1
+
+    threads = [threading.Thread(target=thread_a), threading.Thread(target=thread_b)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert super_stepper._batch_depth == 0
+
+
+def test_nested_batches():
+    with super_stepper.batch_updates():
+        with super_stepper.batch_updates():
+            assert super_stepper._batch_depth == 2
+        assert super_stepper._batch_depth == 1
+    assert super_stepper._batch_depth == 0